@@ -5,11 +5,20 @@ import logging
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME, Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.storage import Store
 
 from .api import ISolarCloudAPI
-from .const import CONF_APPKEY, CONF_HOST, CONF_SECRET_KEY, DOMAIN
+from .const import (
+    CONF_APPKEY,
+    CONF_HOST,
+    CONF_SECRET_KEY,
+    DOMAIN,
+    STORAGE_KEY,
+    STORAGE_VERSION,
+)
 from .coordinator import SungrowDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -31,19 +40,48 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     )
 
     coordinator = SungrowDataUpdateCoordinator(hass, entry, api)
+    if coordinator.integrated_energy:
+        await coordinator.async_load_integrations()
+    else:
+        # Clean up after integrated energy sensors that have been switched off
+        _async_remove_integrated_entities(hass, entry)
+        await coordinator.async_remove_integrations()
 
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+
     return True
 
 
+@callback
+def _async_remove_integrated_entities(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove integrated energy sensors from the entity registry."""
+    registry = er.async_get(hass)
+    for entity in er.async_entries_for_config_entry(registry, entry.entry_id):
+        if entity.unique_id.endswith("_integrated"):
+            registry.async_remove(entity.entity_id)
+
+
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the config entry when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         coordinator: SungrowDataUpdateCoordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        await coordinator.async_save_integrations()
         await coordinator.api.close()
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove stored integrated energy state when a config entry is deleted."""
+    store: Store = Store(hass, STORAGE_VERSION, STORAGE_KEY.format(entry_id=entry.entry_id))
+    await store.async_remove()
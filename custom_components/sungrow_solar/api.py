@@ -1,16 +1,37 @@
 """iSolarCloud API client for Sungrow Solar integration."""
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
 from typing import Any
 
 import aiohttp
 
-from .const import DEVICE_TYPE_ESS, POINT_IDS
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from .const import DEVICE_TYPE_ESS, POINT_IDS, REQUEST_TIMEOUT
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def _json_loads(data: bytes) -> Any:
+    """Deserialize JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 class ISolarCloudError(Exception):
     """Base exception for iSolarCloud API errors."""
 
@@ -35,12 +56,32 @@ class ISolarCloudAPI:
         self.host = host.rstrip("/")
         self.username = username
         self.password = password
-        self.appkey = appkey
-        self.secret_key = secret_key
+        self._appkey = appkey
+        self._secret_key = secret_key
         self._session = session
         self._token: str | None = None
         self._user_id: str | None = None
         self._owns_session = False
+        self._timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+
+        # Static request parts are built once rather than on every call
+        self._headers = {
+            "Content-Type": "application/json;charset=UTF-8",
+            "sys_code": "901",
+            "x-access-key": secret_key,
+        }
+        # Serialized envelope with the closing brace removed, e.g. b'{"appkey":"..","lang":".."'
+        self._envelope = _json_dumps({"appkey": appkey, "lang": "_en_US"})[:-1]
+
+    @property
+    def appkey(self) -> str:
+        """Return the app key sent with every request."""
+        return self._appkey
+
+    @property
+    def secret_key(self) -> str:
+        """Return the secret key sent with every request."""
+        return self._secret_key
 
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create aiohttp session."""
@@ -49,6 +90,13 @@ class ISolarCloudAPI:
             self._owns_session = True
         return self._session
 
+    def _encode_body(self, body: dict[str, Any]) -> bytes:
+        """Encode a request body, merging it into the prebuilt envelope."""
+        if not body:
+            return self._envelope + b"}"
+        # Splice the body's members in after the envelope's
+        return self._envelope + b"," + _json_dumps(body)[1:]
+
     async def close(self) -> None:
         """Close the API client session."""
         if self._owns_session and self._session and not self._session.closed:
@@ -64,17 +112,7 @@ class ISolarCloudAPI:
         session = await self._get_session()
         url = f"{self.host}{endpoint}"
 
-        headers = {
-            "Content-Type": "application/json;charset=UTF-8",
-            "sys_code": "901",
-            "x-access-key": self.secret_key,
-        }
-
-        request_body: dict[str, Any] = {
-            "appkey": self.appkey,
-            "lang": "_en_US",
-            **(body or {}),
-        }
+        request_body: dict[str, Any] = dict(body or {})
 
         if requires_token and self._token:
             request_body["token"] = self._token
@@ -82,10 +120,17 @@ class ISolarCloudAPI:
         _LOGGER.debug("API request to %s: %s", endpoint, request_body)
 
         try:
-            async with session.post(url, headers=headers, json=request_body) as response:
-                data = await response.json()
-        except aiohttp.ClientError as err:
+            async with session.post(
+                url,
+                headers=self._headers,
+                data=self._encode_body(request_body),
+                timeout=self._timeout,
+            ) as response:
+                data = _json_loads(await response.read())
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
             raise ISolarCloudError(f"Request failed: {err}") from err
+        except ValueError as err:
+            raise ISolarCloudError(f"Invalid response: {err}") from err
 
         _LOGGER.debug("API response from %s: %s", endpoint, data.get("result_code"))
 
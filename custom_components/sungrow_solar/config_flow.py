@@ -6,8 +6,14 @@ from typing import Any
 
 import voluptuous as vol
 
-from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
+from homeassistant.config_entries import (
+    ConfigEntry,
+    ConfigFlow,
+    ConfigFlowResult,
+    OptionsFlow,
+)
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .api import AuthenticationError, ISolarCloudAPI, ISolarCloudError
@@ -15,9 +21,11 @@ from .const import (
     API_HOSTS,
     CONF_APPKEY,
     CONF_HOST,
+    CONF_INTEGRATED_ENERGY,
     CONF_POLL_INTERVAL,
     CONF_SECRET_KEY,
     DEFAULT_HOST,
+    DEFAULT_INTEGRATED_ENERGY,
     DEFAULT_POLL_INTERVAL,
     DOMAIN,
 )
@@ -30,6 +38,12 @@ class SungrowSolarConfigFlow(ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> SungrowSolarOptionsFlow:
+        """Get the options flow for this handler."""
+        return SungrowSolarOptionsFlow()
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
@@ -89,7 +103,37 @@ class SungrowSolarConfigFlow(ConfigFlow, domain=DOMAIN):
                     vol.Optional(
                         CONF_POLL_INTERVAL, default=DEFAULT_POLL_INTERVAL
                     ): vol.All(vol.Coerce(int), vol.Range(min=60, max=600)),
+                    vol.Optional(
+                        CONF_INTEGRATED_ENERGY, default=DEFAULT_INTEGRATED_ENERGY
+                    ): bool,
                 }
             ),
             errors=errors,
         )
+
+
+class SungrowSolarOptionsFlow(OptionsFlow):
+    """Handle options for Sungrow Solar."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+
+        integrated_energy = self.config_entry.options.get(
+            CONF_INTEGRATED_ENERGY,
+            self.config_entry.data.get(CONF_INTEGRATED_ENERGY, DEFAULT_INTEGRATED_ENERGY),
+        )
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_INTEGRATED_ENERGY, default=integrated_energy
+                    ): bool,
+                }
+            ),
+        )
@@ -20,10 +20,20 @@ CONF_HOST = "host"
 CONF_APPKEY = "appkey"
 CONF_SECRET_KEY = "secret_key"
 CONF_POLL_INTERVAL = "poll_interval"
+CONF_INTEGRATED_ENERGY = "integrated_energy"
 
 # Default values
 DEFAULT_POLL_INTERVAL = 300  # 5 minutes
 DEFAULT_HOST = "https://gateway.isolarcloud.com"
+DEFAULT_INTEGRATED_ENERGY = False
+
+# Storage for integrated energy state across restarts
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{DOMAIN}.{{entry_id}}"
+STORAGE_SAVE_DELAY = 60  # seconds
+
+# Longest gap between power samples that is still integrated
+INTEGRATION_MAX_GAP = 1200  # 20 minutes
 
 # API hosts by region
 API_HOSTS = {
@@ -33,6 +43,9 @@ API_HOSTS = {
     "Australia": "https://augateway.isolarcloud.com",
 }
 
+# Timeout for each API request
+REQUEST_TIMEOUT = 30  # seconds
+
 # Device type for Energy Storage System
 DEVICE_TYPE_ESS = 14
 
@@ -88,3 +101,43 @@ SENSOR_TYPES = {
 
 # List of all point IDs to request from API
 POINT_IDS = list(SENSOR_TYPES.keys())
+
+# Derived metrics computed by the coordinator from the parsed point snapshot
+# Format: metric_key -> (name, unit, device_class, state_class, icon)
+DERIVED_SENSOR_TYPES = {
+    "self_consumption": ("Self Consumption", PERCENTAGE, None, SensorStateClass.MEASUREMENT, "mdi:home-percent"),
+    "self_sufficiency": ("Self Sufficiency", PERCENTAGE, None, SensorStateClass.MEASUREMENT, "mdi:home-battery"),
+    "net_grid_power": ("Net Grid Power", UnitOfPower.WATT, SensorDeviceClass.POWER, SensorStateClass.MEASUREMENT, "mdi:transmission-tower"),
+    "battery_round_trip_efficiency": ("Battery Round Trip Efficiency", PERCENTAGE, None, SensorStateClass.MEASUREMENT, "mdi:battery-sync"),
+    "load_balance": ("Load Balance", UnitOfPower.WATT, SensorDeviceClass.POWER, SensorStateClass.MEASUREMENT, "mdi:scale-balance"),
+}
+
+# Point IDs each derived metric depends on, in the order passed to its calculation
+DERIVED_INPUTS = {
+    "self_consumption": ("13112", "13122"),
+    "self_sufficiency": ("13199", "13147"),
+    "net_grid_power": ("13149", "13121"),
+    "battery_round_trip_efficiency": ("13035", "13034"),
+    "load_balance": ("13003", "13149", "13150", "13121", "13126", "13119"),
+}
+
+# Daily energy counters refined by integrating power between polls
+# Format: counter point_id -> power point_id
+INTEGRATED_ENERGY_SOURCES = {
+    "13112": "13003",
+    "13122": "13121",
+    "13147": "13149",
+    "13199": "13119",
+    "13028": "13126",
+    "13029": "13150",
+}
+
+# Format: counter point_id -> (name, unit, device_class, state_class, icon)
+INTEGRATED_SENSOR_TYPES = {
+    "13112": ("Solar Energy Today (Integrated)", UnitOfEnergy.WATT_HOUR, SensorDeviceClass.ENERGY, SensorStateClass.TOTAL_INCREASING, "mdi:solar-power"),
+    "13122": ("Grid Export Energy Today (Integrated)", UnitOfEnergy.WATT_HOUR, SensorDeviceClass.ENERGY, SensorStateClass.TOTAL_INCREASING, "mdi:transmission-tower-export"),
+    "13147": ("Grid Import Energy Today (Integrated)", UnitOfEnergy.WATT_HOUR, SensorDeviceClass.ENERGY, SensorStateClass.TOTAL_INCREASING, "mdi:transmission-tower-import"),
+    "13199": ("Load Energy Today (Integrated)", UnitOfEnergy.WATT_HOUR, SensorDeviceClass.ENERGY, SensorStateClass.TOTAL_INCREASING, "mdi:home-lightning-bolt"),
+    "13028": ("Battery Charge Energy Today (Integrated)", UnitOfEnergy.WATT_HOUR, SensorDeviceClass.ENERGY, SensorStateClass.TOTAL_INCREASING, "mdi:battery-charging"),
+    "13029": ("Battery Discharge Energy Today (Integrated)", UnitOfEnergy.WATT_HOUR, SensorDeviceClass.ENERGY, SensorStateClass.TOTAL_INCREASING, "mdi:battery-minus"),
+}
@@ -1,6 +1,7 @@
 """DataUpdateCoordinator for Sungrow Solar integration."""
 from __future__ import annotations
 
+from collections.abc import Callable
 from datetime import timedelta
 import logging
 from typing import Any
@@ -8,22 +9,146 @@ from typing import Any
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
 from .api import AuthenticationError, ISolarCloudAPI, ISolarCloudError
 from .const import (
     CONF_APPKEY,
     CONF_HOST,
+    CONF_INTEGRATED_ENERGY,
     CONF_POLL_INTERVAL,
     CONF_SECRET_KEY,
+    DEFAULT_INTEGRATED_ENERGY,
     DEFAULT_POLL_INTERVAL,
+    DERIVED_INPUTS,
     DEVICE_TYPE_ESS,
     DOMAIN,
+    INTEGRATED_ENERGY_SOURCES,
+    INTEGRATION_MAX_GAP,
+    STORAGE_KEY,
+    STORAGE_SAVE_DELAY,
+    STORAGE_VERSION,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _ratio_percent(part: float, whole: float) -> float | None:
+    """Return part/whole as a percentage clamped to 0-100."""
+    if whole <= 0:
+        return None
+    return round(min(max(part / whole * 100, 0.0), 100.0), 1)
+
+
+def _self_consumption(solar: float, export: float) -> float | None:
+    """Share of today's solar energy used on site rather than exported."""
+    return _ratio_percent(solar - export, solar)
+
+
+def _self_sufficiency(load: float, grid_import: float) -> float | None:
+    """Share of today's load energy not drawn from the grid."""
+    return _ratio_percent(load - grid_import, load)
+
+
+def _net_grid_power(grid_import: float, export: float) -> float:
+    """Grid import minus export power (negative when exporting)."""
+    return grid_import - export
+
+
+def _round_trip_efficiency(discharged: float, charged: float) -> float | None:
+    """Lifetime battery discharge energy as a percentage of charge energy."""
+    return _ratio_percent(discharged, charged)
+
+
+def _load_balance(
+    pv: float,
+    grid_import: float,
+    discharge: float,
+    export: float,
+    charge: float,
+    load: float,
+) -> float:
+    """Power sources minus sinks; near zero when the reported flows agree."""
+    return pv + grid_import + discharge - export - charge - load
+
+
+# metric_key -> calculation, called with the values of DERIVED_INPUTS[metric_key]
+DERIVED_CALCULATIONS: dict[str, Callable[..., float | None]] = {
+    "self_consumption": _self_consumption,
+    "self_sufficiency": _self_sufficiency,
+    "net_grid_power": _net_grid_power,
+    "battery_round_trip_efficiency": _round_trip_efficiency,
+    "load_balance": _load_balance,
+}
+
+
+def _advance_integration(
+    state: dict[str, Any] | None,
+    counter: float | None,
+    power: float | None,
+    now: float,
+) -> dict[str, Any]:
+    """Advance one integrated energy counter to a new poll sample.
+
+    Energy is accumulated with the trapezoidal rule between successive power
+    samples and re-anchored to the cloud counter whenever it advances. The
+    value never moves backwards except when the cloud counter itself resets,
+    so when the integration has run ahead of the counter it is held until
+    the counter catches up. Between counter updates the value is capped at
+    the last counter plus the counter's previous step.
+    """
+    if state is None:
+        return {
+            "value": counter,
+            "counter": counter,
+            "step": None,
+            "held": False,
+            "power": power,
+            "time": now,
+        }
+
+    value = state["value"]
+    last_counter = state["counter"]
+    step = state.get("step")
+    held = state.get("held", False)
+
+    if counter is not None and last_counter is not None and counter < last_counter:
+        # Daily counter has reset
+        value = counter
+        step = None
+        held = False
+    elif counter is not None and (last_counter is None or counter > last_counter):
+        # Counter advanced: anchor to it, or hold if the integration ran ahead
+        if last_counter is not None:
+            step = counter - last_counter
+        if value is None or value <= counter:
+            value = counter
+            held = False
+        else:
+            held = True
+    elif not held and value is not None:
+        gap = now - state["time"]
+        if (
+            power is not None
+            and state["power"] is not None
+            and 0 < gap <= INTEGRATION_MAX_GAP
+        ):
+            value += (state["power"] + power) / 2 * gap / 3600
+            if step is not None and last_counter is not None:
+                value = min(value, last_counter + step)
+
+    return {
+        "value": value,
+        "counter": counter if counter is not None else last_counter,
+        "step": step,
+        "held": held,
+        "power": power,
+        "time": now,
+    }
+
+
 class SungrowDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Coordinator to manage fetching Sungrow data from iSolarCloud API."""
 
@@ -39,6 +164,19 @@ class SungrowDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self.api = api
         self.plants: list[dict[str, Any]] = []
         self.devices: dict[str, list[dict[str, Any]]] = {}  # ps_id -> devices
+        # source key (ps_key or plant_<ps_id>) -> metric_key -> (inputs, value)
+        self._derived_cache: dict[str, dict[str, tuple[tuple[float | None, ...], float | None]]] = {}
+
+        # Options override the value chosen when the entry was created
+        self.integrated_energy: bool = entry.options.get(
+            CONF_INTEGRATED_ENERGY,
+            entry.data.get(CONF_INTEGRATED_ENERGY, DEFAULT_INTEGRATED_ENERGY),
+        )
+        # ps_key -> counter point_id -> integration state
+        self._integrations: dict[str, dict[str, dict[str, Any]]] = {}
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, STORAGE_KEY.format(entry_id=entry.entry_id)
+        )
 
         poll_interval = entry.data.get(CONF_POLL_INTERVAL, DEFAULT_POLL_INTERVAL)
 
@@ -111,6 +249,10 @@ class SungrowDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 except ISolarCloudError as err:
                     _LOGGER.warning("Error fetching devices for plant %s: %s", ps_id, err)
 
+            self._update_derived(all_data)
+            if self.integrated_energy:
+                self._update_integrations(all_data)
+
             return all_data
 
         except AuthenticationError as err:
@@ -137,6 +279,155 @@ class SungrowDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         return parsed
 
+    def _update_derived(self, all_data: dict[str, Any]) -> None:
+        """Attach derived metrics to each device and plant in the snapshot."""
+        plant_points: dict[str, list[dict[str, float | None]]] = {}
+
+        for ps_key, device in all_data["devices"].items():
+            device["derived"] = self._compute_derived(ps_key, device["points"])
+            plant_points.setdefault(device["ps_id"], []).append(device["points"])
+
+        for ps_id, plant in all_data["plants"].items():
+            plant["derived"] = self._compute_derived(
+                f"plant_{ps_id}",
+                self._sum_points(plant_points.get(ps_id, [])),
+            )
+
+        # Drop cache entries for devices and plants that have disappeared
+        if (known := self._known_sources()) is not None:
+            for key in self._derived_cache.keys() - known:
+                del self._derived_cache[key]
+
+    def _known_sources(self) -> set[str] | None:
+        """Return ps_keys and plant sources from the last successful listings.
+
+        Returns None while any plant has never been listed successfully, so
+        state is not dropped for devices that are only temporarily missing.
+        """
+        ps_ids = [str(plant.get("ps_id", "")) for plant in self.plants]
+        if any(ps_id not in self.devices for ps_id in ps_ids):
+            return None
+
+        known = {f"plant_{ps_id}" for ps_id in ps_ids}
+        for ps_id in ps_ids:
+            known.update(d["ps_key"] for d in self.devices[ps_id] if d.get("ps_key"))
+        return known
+
+    def _compute_derived(
+        self, source: str, points: dict[str, float | None]
+    ) -> dict[str, float | None]:
+        """Compute derived metrics for a device or plant.
+
+        Each metric keeps the inputs it was last computed from and reuses its
+        value while they are unchanged. The calculations themselves are cheap,
+        so this saves little; the real saving over template sensors is that
+        each metric is computed once per refresh.
+        """
+        cache = self._derived_cache.setdefault(source, {})
+        derived: dict[str, float | None] = {}
+
+        for metric, point_ids in DERIVED_INPUTS.items():
+            inputs = tuple(points.get(point_id) for point_id in point_ids)
+            cached = cache.get(metric)
+
+            if cached is not None and cached[0] == inputs:
+                derived[metric] = cached[1]
+                continue
+
+            if any(value is None for value in inputs):
+                value = None
+            else:
+                value = DERIVED_CALCULATIONS[metric](*inputs)
+
+            cache[metric] = (inputs, value)
+            derived[metric] = value
+
+        return derived
+
+    @staticmethod
+    def _sum_points(
+        device_points: list[dict[str, float | None]],
+    ) -> dict[str, float | None]:
+        """Sum the derived-metric inputs across a plant's devices."""
+        totals: dict[str, float | None] = {}
+
+        for point_ids in DERIVED_INPUTS.values():
+            for point_id in point_ids:
+                if point_id in totals:
+                    continue
+                values = [p[point_id] for p in device_points if p.get(point_id) is not None]
+                totals[point_id] = sum(values) if values else None
+
+        return totals
+
+    async def async_load_integrations(self) -> None:
+        """Restore integrated energy state saved before the last restart."""
+        if stored := await self._store.async_load():
+            self._integrations = stored.get("devices", {})
+
+    async def async_remove_integrations(self) -> None:
+        """Discard integrated energy state and its storage."""
+        self._integrations = {}
+        await self._store.async_remove()
+
+    async def async_save_integrations(self) -> None:
+        """Persist integrated energy state immediately."""
+        if self.integrated_energy:
+            await self._store.async_save(self._integration_data())
+
+    def _integration_data(self) -> dict[str, Any]:
+        """Return integrated energy state for storage."""
+        return {"devices": self._integrations}
+
+    def _update_integrations(self, all_data: dict[str, Any]) -> None:
+        """Advance integrated energy counters with this refresh's power samples."""
+        now = dt_util.utcnow().timestamp()
+
+        for ps_key, device in all_data["devices"].items():
+            points = device["points"]
+            states = self._integrations.setdefault(ps_key, {})
+            integrated: dict[str, float | None] = {}
+
+            for counter_id, power_id in INTEGRATED_ENERGY_SOURCES.items():
+                state = _advance_integration(
+                    states.get(counter_id),
+                    points.get(counter_id),
+                    points.get(power_id),
+                    now,
+                )
+                states[counter_id] = state
+                value = state["value"]
+                integrated[counter_id] = round(value, 1) if value is not None else None
+
+            device["integrated"] = integrated
+
+        # Drop state for devices that have disappeared; devices missing from a
+        # failed refresh keep theirs and the integration gap limit applies
+        if (known := self._known_sources()) is not None:
+            for ps_key in self._integrations.keys() - known:
+                del self._integrations[ps_key]
+
+        self._store.async_delay_save(self._integration_data, STORAGE_SAVE_DELAY)
+
+    def get_integrated_value(self, ps_key: str, point_id: str) -> float | None:
+        """Get an integrated energy value for a device counter."""
+        if not self.data:
+            return None
+
+        device = self.data.get("devices", {}).get(ps_key, {})
+        return device.get("integrated", {}).get(point_id)
+
+    def get_derived_value(self, source: str, metric: str) -> float | None:
+        """Get a derived metric for a device (ps_key) or plant (plant_<ps_id>)."""
+        if not self.data:
+            return None
+
+        if source.startswith("plant_"):
+            entry = self.data.get("plants", {}).get(source.removeprefix("plant_"), {})
+        else:
+            entry = self.data.get("devices", {}).get(source, {})
+        return entry.get("derived", {}).get(metric)
+
     def get_device_value(self, ps_key: str, point_id: str) -> float | None:
         """Get a specific value from device data."""
         if not self.data:
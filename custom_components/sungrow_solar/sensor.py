@@ -15,7 +15,7 @@ from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, SENSOR_TYPES
+from .const import DERIVED_SENSOR_TYPES, DOMAIN, INTEGRATED_SENSOR_TYPES, SENSOR_TYPES
 from .coordinator import SungrowDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -32,7 +32,7 @@ async def async_setup_entry(
     # Wait for first refresh to get device data
     await coordinator.async_config_entry_first_refresh()
 
-    entities: list[SungrowSensorEntity] = []
+    entities: list[SungrowBaseSensorEntity] = []
 
     # Create sensors for each device
     if coordinator.data:
@@ -59,29 +59,76 @@ async def async_setup_entry(
                     )
                 )
 
+            # Create derived metric sensors for each device
+            device_info = DeviceInfo(identifiers={(DOMAIN, device_sn)})
+            for metric, sensor_config in DERIVED_SENSOR_TYPES.items():
+                entities.append(
+                    SungrowDerivedSensorEntity(
+                        coordinator=coordinator,
+                        source=ps_key,
+                        metric=metric,
+                        device_info=device_info,
+                        sensor_config=sensor_config,
+                    )
+                )
+
+            # Create integrated energy sensors when enabled
+            if coordinator.integrated_energy:
+                for point_id, sensor_config in INTEGRATED_SENSOR_TYPES.items():
+                    entities.append(
+                        SungrowIntegratedEnergySensorEntity(
+                            coordinator=coordinator,
+                            ps_key=ps_key,
+                            point_id=point_id,
+                            device_info=device_info,
+                            sensor_config=sensor_config,
+                        )
+                    )
+
+        # Create plant total derived sensors for plants with devices
+        plant_ids = {
+            device_data.get("ps_id", "")
+            for device_data in coordinator.data.get("devices", {}).values()
+        }
+        for ps_id in plant_ids:
+            plant_info = coordinator.data.get("plants", {}).get(ps_id, {})
+            device_info = DeviceInfo(
+                identifiers={(DOMAIN, f"plant_{ps_id}")},
+                name=plant_info.get("name", f"Plant {ps_id}"),
+                manufacturer="Sungrow",
+                model="Power Station",
+            )
+            for metric, sensor_config in DERIVED_SENSOR_TYPES.items():
+                entities.append(
+                    SungrowDerivedSensorEntity(
+                        coordinator=coordinator,
+                        source=f"plant_{ps_id}",
+                        metric=metric,
+                        device_info=device_info,
+                        sensor_config=sensor_config,
+                    )
+                )
+
     async_add_entities(entities)
 
 
-class SungrowSensorEntity(CoordinatorEntity[SungrowDataUpdateCoordinator], SensorEntity):
-    """Representation of a Sungrow sensor."""
+class SungrowBaseSensorEntity(CoordinatorEntity[SungrowDataUpdateCoordinator], SensorEntity):
+    """Base for Sungrow sensors belonging to a device (ps_key) or plant (plant_<ps_id>)."""
 
     _attr_has_entity_name = True
 
     def __init__(
         self,
         coordinator: SungrowDataUpdateCoordinator,
-        ps_key: str,
-        point_id: str,
-        device_name: str,
-        device_sn: str,
-        plant_name: str,
+        source: str,
+        unique_id: str,
+        device_info: DeviceInfo,
         sensor_config: tuple,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
 
-        self._ps_key = ps_key
-        self._point_id = point_id
+        self._source = source
 
         # Unpack sensor configuration
         name, unit, device_class, state_class, icon = sensor_config
@@ -91,12 +138,40 @@ class SungrowSensorEntity(CoordinatorEntity[SungrowDataUpdateCoordinator], Senso
         self._attr_device_class = device_class
         self._attr_state_class = state_class
         self._attr_icon = icon
+        self._attr_unique_id = unique_id
+        self._attr_device_info = device_info
+
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        if not self.coordinator.last_update_success:
+            return False
+
+        # Check if device or plant still exists in data
+        if not self.coordinator.data:
+            return False
+
+        if self._source.startswith("plant_"):
+            return self._source.removeprefix("plant_") in self.coordinator.data.get("plants", {})
+        return self._source in self.coordinator.data.get("devices", {})
 
-        # Create unique ID
-        self._attr_unique_id = f"{ps_key}_{point_id}"
 
+class SungrowSensorEntity(SungrowBaseSensorEntity):
+    """Representation of a Sungrow sensor."""
+
+    def __init__(
+        self,
+        coordinator: SungrowDataUpdateCoordinator,
+        ps_key: str,
+        point_id: str,
+        device_name: str,
+        device_sn: str,
+        plant_name: str,
+        sensor_config: tuple,
+    ) -> None:
+        """Initialize the sensor."""
         # Device info groups sensors by physical device
-        self._attr_device_info = DeviceInfo(
+        device_info = DeviceInfo(
             identifiers={(DOMAIN, device_sn)},
             name=f"{plant_name} {device_name}",
             manufacturer="Sungrow",
@@ -104,19 +179,65 @@ class SungrowSensorEntity(CoordinatorEntity[SungrowDataUpdateCoordinator], Senso
             serial_number=device_sn,
         )
 
+        super().__init__(
+            coordinator, ps_key, f"{ps_key}_{point_id}", device_info, sensor_config
+        )
+
+        self._point_id = point_id
+
     @property
     def native_value(self) -> float | None:
         """Return the state of the sensor."""
-        return self.coordinator.get_device_value(self._ps_key, self._point_id)
+        return self.coordinator.get_device_value(self._source, self._point_id)
+
+
+class SungrowDerivedSensorEntity(SungrowBaseSensorEntity):
+    """Representation of a metric derived by the coordinator for a device or plant."""
+
+    def __init__(
+        self,
+        coordinator: SungrowDataUpdateCoordinator,
+        source: str,
+        metric: str,
+        device_info: DeviceInfo,
+        sensor_config: tuple,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(
+            coordinator, source, f"{source}_{metric}", device_info, sensor_config
+        )
+
+        self._metric = metric
 
     @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        if not self.coordinator.last_update_success:
-            return False
+    def native_value(self) -> float | None:
+        """Return the state of the sensor."""
+        return self.coordinator.get_derived_value(self._source, self._metric)
 
-        # Check if device still exists in data
-        if not self.coordinator.data:
-            return False
 
-        return self._ps_key in self.coordinator.data.get("devices", {})
+class SungrowIntegratedEnergySensorEntity(SungrowBaseSensorEntity):
+    """Representation of a daily energy counter integrated from power readings."""
+
+    def __init__(
+        self,
+        coordinator: SungrowDataUpdateCoordinator,
+        ps_key: str,
+        point_id: str,
+        device_info: DeviceInfo,
+        sensor_config: tuple,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(
+            coordinator,
+            ps_key,
+            f"{ps_key}_{point_id}_integrated",
+            device_info,
+            sensor_config,
+        )
+
+        self._point_id = point_id
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the state of the sensor."""
+        return self.coordinator.get_integrated_value(self._source, self._point_id)
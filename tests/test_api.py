@@ -0,0 +1,71 @@
+"""Tests for the iSolarCloud API client."""
+import asyncio
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.sungrow_solar import api as api_module
+from custom_components.sungrow_solar.api import ISolarCloudAPI, ISolarCloudError
+
+
+@pytest.fixture(params=["orjson", "json"])
+def codec(request, monkeypatch):
+    """Run each test with orjson and with the json fallback."""
+    if request.param == "json":
+        monkeypatch.setattr(api_module, "orjson", None)
+    elif api_module.orjson is None:
+        pytest.skip("orjson is not installed")
+    return request.param
+
+
+def _api(session=None):
+    """Create a client with fixed credentials."""
+    return ISolarCloudAPI(
+        host="https://gateway.example.com",
+        username="user",
+        password="pass",
+        appkey="APPKEY",
+        secret_key="SECRET",
+        session=session,
+    )
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        {},
+        {"ps_id": "123", "curPage": 1, "point_id_list": ["13011", "13003"]},
+        {"ps_name": "Maison du Soleil ☀ – Zürich", "token": "ä\"\\"},
+    ],
+)
+def test_encode_body(codec, body):
+    """The body is merged into the prebuilt envelope as valid JSON."""
+    encoded = _api()._encode_body(body)
+
+    assert json.loads(encoded) == {"appkey": "APPKEY", "lang": "_en_US", **body}
+
+
+class _Response:
+    """Minimal response returned by the fake session."""
+
+    def __init__(self, payload: bytes) -> None:
+        self._payload = payload
+
+    async def read(self) -> bytes:
+        return self._payload
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+
+def test_invalid_json_response(codec):
+    """A response that is not JSON raises ISolarCloudError."""
+    session = MagicMock(closed=False)
+    session.post.return_value = _Response(b"<html>Bad Gateway</html>")
+
+    with pytest.raises(ISolarCloudError, match="Invalid response"):
+        asyncio.run(_api(session)._request("/openapi/login", requires_token=False))
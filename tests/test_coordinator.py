@@ -0,0 +1,205 @@
+"""Tests for the Sungrow Solar coordinator."""
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from custom_components.sungrow_solar.coordinator import (
+    DERIVED_CALCULATIONS,
+    SungrowDataUpdateCoordinator,
+    _advance_integration,
+    _ratio_percent,
+)
+
+POLL = 300  # seconds
+
+
+def _run(samples):
+    """Feed (counter, power) samples one poll apart and return the values."""
+    state = None
+    values = []
+    for index, (counter, power) in enumerate(samples):
+        state = _advance_integration(state, counter, power, index * POLL)
+        values.append(state["value"])
+    return values
+
+
+def _samples(true_power, reported_power, polls, counter_step):
+    """Build samples for a constant load with a counter that moves in steps."""
+    samples = []
+    for index in range(polls):
+        energy = true_power * index * POLL / 3600
+        counter = energy // counter_step * counter_step
+        samples.append((counter, reported_power))
+    return samples
+
+
+def test_over_estimation_is_held_until_counter_catches_up():
+    """Power reading 10% high never runs more than one step ahead."""
+    samples = _samples(600, 660, 13, 100)
+    values = _run(samples)
+
+    for value, (counter, _) in zip(values, samples):
+        assert counter <= value <= counter + 100
+    assert values == sorted(values)
+    assert values[-1] == samples[-1][0]
+
+
+def test_under_estimation_is_anchored_to_counter():
+    """Power reading 10% low is pulled up to the counter when it advances."""
+    samples = _samples(600, 540, 13, 100)
+    values = _run(samples)
+
+    assert values == sorted(values)
+    for value, (counter, _), previous in zip(values[1:], samples[1:], samples):
+        if counter > previous[0]:
+            assert value == counter
+        assert value >= counter
+
+
+def test_integrates_between_counter_updates():
+    """Energy accumulates from power while the counter is flat."""
+    values = _run([(1000, 3600), (1000, 3600), (1000, 3600)])
+
+    assert values == [1000, 1300, 1600]
+
+
+def test_daily_reset():
+    """A counter reset restarts the value from the new counter."""
+    values = _run([(5000, 1200), (5000, 1200), (0, 0), (0, 1200)])
+
+    assert values[1] == 5100
+    assert values[2] == 0
+    assert values[3] == 50
+
+
+def _coordinator():
+    """Create a coordinator with one plant and device, without Home Assistant."""
+    coordinator = SungrowDataUpdateCoordinator.__new__(SungrowDataUpdateCoordinator)
+    coordinator.plants = [{"ps_id": 1}]
+    coordinator.devices = {"1": [{"ps_key": "a"}]}
+    coordinator._derived_cache = {}
+    coordinator._integrations = {}
+    coordinator._store = MagicMock()
+    return coordinator
+
+
+def _snapshot(*ps_keys):
+    """Build refresh data with the given devices reporting."""
+    return {
+        "plants": {"1": {"ps_id": "1"}},
+        "devices": {
+            ps_key: {"ps_id": "1", "points": {"13112": 1000.0, "13003": 3600.0}}
+            for ps_key in ps_keys
+        },
+    }
+
+
+def _integrate(coordinator, all_data, now):
+    """Run one integration refresh at the given time."""
+    with patch("custom_components.sungrow_solar.coordinator.dt_util") as dt_util:
+        dt_util.utcnow.return_value.timestamp.return_value = now
+        coordinator._update_integrations(all_data)
+    return all_data["devices"].get("a", {}).get("integrated", {}).get("13112")
+
+
+def test_missing_device_keeps_integration_state():
+    """A device left out of a failed refresh keeps integrating afterwards."""
+    coordinator = _coordinator()
+
+    assert _integrate(coordinator, _snapshot("a"), 0) == 1000
+    assert _integrate(coordinator, _snapshot("a"), 300) == 1300
+    assert _integrate(coordinator, _snapshot(), 600) is None
+    assert _integrate(coordinator, _snapshot("a"), 900) == 1900
+
+
+def test_removed_device_integration_state_is_pruned():
+    """State is dropped once a successful listing no longer has the device."""
+    coordinator = _coordinator()
+    _integrate(coordinator, _snapshot("a"), 0)
+
+    coordinator.devices = {"1": []}
+    _integrate(coordinator, _snapshot(), 300)
+
+    assert "a" not in coordinator._integrations
+
+
+@pytest.mark.parametrize(
+    ("part", "whole", "expected"),
+    [
+        (50, 200, 25.0),
+        (1, 3, 33.3),
+        (-10, 100, 0.0),
+        (150, 100, 100.0),
+        (10, 0, None),
+        (10, -5, None),
+    ],
+)
+def test_ratio_percent(part, whole, expected):
+    """Ratios are rounded, clamped to 0-100 and None without a denominator."""
+    assert _ratio_percent(part, whole) == expected
+
+
+@pytest.mark.parametrize(
+    ("metric", "inputs", "expected"),
+    [
+        ("self_consumption", (10000, 2500), 75.0),
+        ("self_consumption", (0, 0), None),
+        ("self_sufficiency", (8000, 2000), 75.0),
+        ("self_sufficiency", (0, 100), None),
+        ("net_grid_power", (500, 0), 500),
+        ("net_grid_power", (0, 1200), -1200),
+        ("battery_round_trip_efficiency", (9000, 10000), 90.0),
+        ("battery_round_trip_efficiency", (0, 0), None),
+        ("load_balance", (3000, 200, 500, 1000, 700, 2000), 0),
+        ("load_balance", (3000, 0, 0, 0, 0, 2500), 500),
+    ],
+)
+def test_derived_calculations(metric, inputs, expected):
+    """Each derived metric formula."""
+    assert DERIVED_CALCULATIONS[metric](*inputs) == expected
+
+
+def test_missing_input_gives_none():
+    """A metric with any missing input is None."""
+    coordinator = _coordinator()
+
+    derived = coordinator._compute_derived("a", {"13149": 500.0, "13121": None})
+
+    assert derived["net_grid_power"] is None
+    assert derived["self_consumption"] is None
+
+
+def test_sum_points_skips_missing_values():
+    """Plant totals sum the devices that report a value."""
+    totals = SungrowDataUpdateCoordinator._sum_points(
+        [
+            {"13112": 1000.0, "13122": None},
+            {"13112": 500.0, "13122": None},
+            {"13112": None, "13122": None},
+        ]
+    )
+
+    assert totals["13112"] == 1500.0
+    assert totals["13122"] is None
+    assert totals["13119"] is None
+
+
+def test_derived_cache_reuse_and_invalidation():
+    """Metrics are only recalculated when their inputs change."""
+    coordinator = _coordinator()
+    calculation = MagicMock(return_value=100.0)
+    points = {"13149": 500.0, "13121": 400.0}
+
+    with patch.dict(DERIVED_CALCULATIONS, {"net_grid_power": calculation}):
+        coordinator._compute_derived("a", points)
+        coordinator._compute_derived("a", dict(points, **{"13112": 1000.0}))
+        assert calculation.call_count == 1
+
+        derived = coordinator._compute_derived("a", dict(points, **{"13121": 0.0}))
+        assert calculation.call_count == 2
+        calculation.assert_called_with(500.0, 0.0)
+
+        coordinator._compute_derived("b", points)
+        assert calculation.call_count == 3
+
+    assert derived["net_grid_power"] == 100.0